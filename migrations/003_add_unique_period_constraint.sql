@@ -0,0 +1,4 @@
+-- Add a unique constraint on (user_id, date, period) so duplicate period
+-- rows cannot be inserted and upserts have a conflict target
+alter table weather_data
+add constraint weather_data_user_id_date_period_key unique (user_id, date, period);
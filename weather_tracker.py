@@ -1,34 +1,74 @@
 #!/usr/bin/env python3
 
+import functools
 import os
 import requests
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
-import json
+import orjson
 from supabase import create_client, Client
 import logging
 import re
 import pytz
+from typing import NamedTuple
+
+def _make_filter(combined, replacements, cheap_tokens):
+    """Build the scrubbing function with its state in closure cells, which
+    the hot logging path reads more cheaply than instance attributes."""
+    def _replace(match):
+        return replacements[match.lastgroup]
+
+    def _filter(record):
+        # Records re-emitted through multiple handlers are scrubbed once
+        if getattr(record, '_scrubbed', False):
+            return True
+        record._scrubbed = True
+        msg = record.msg
+        if isinstance(msg, str):
+            if not any(token in msg for token in cheap_tokens):
+                return True
+            # subn lets us keep the original string object when no
+            # substitution actually happened
+            new_msg, n = combined.subn(_replace, msg)
+            if n:
+                record.msg = new_msg
+        return True
+
+    return _filter
+
 
 class SensitiveDataFilter(logging.Filter):
     """Filter to remove sensitive information from log records."""
-    
-    def __init__(self):
-        super().__init__()
-        # Patterns to match and replace sensitive data
-        self.patterns = [
-            (r'https?://[^/]+\.supabase\.co', '[SUPABASE_URL]'),
-            (r'user_id=eq\.[a-f0-9-]+', 'user_id=eq.[REDACTED]'),
-            (r'[a-f0-9-]{36}', '[UUID]'),  # Matches UUIDs
-            (r'Bearer [A-Za-z0-9-_=]+\.[A-Za-z0-9-_=]+\.?[A-Za-z0-9-_.+/=]*', 'Bearer [REDACTED]'),
-            (r'apikey=[A-Za-z0-9-_=]+', 'apikey=[REDACTED]'),
-        ]
 
-    def filter(self, record):
-        if isinstance(record.msg, str):
-            for pattern, replacement in self.patterns:
-                record.msg = re.sub(pattern, replacement, record.msg)
-        return True
+    # Cheap literal markers; a message containing none of these cannot match
+    # any pattern (the hyphen covers UUIDs), so the regex pass is skipped
+    _CHEAP_TOKENS = ('Bearer ', 'apikey=', 'user_id=eq.', '-')
+
+    # Replacement text for each named group in the combined pattern
+    _REPLACEMENTS = {
+        'bearer': 'Bearer [REDACTED]',
+        'api': 'apikey=[REDACTED]',
+        'uid': 'user_id=eq.[REDACTED]',
+        'uuid': '[UUID]',
+    }
+
+    # All patterns fused into one alternation so each message is scanned
+    # once, ordered most-selective literal prefix first. The old
+    # supabase-URL arm is gone: the only logger that emitted the URL
+    # (httpx) is silenced to WARNING, so it never fired.
+    _COMBINED = re.compile(
+        r'(?P<bearer>Bearer [A-Za-z0-9-_=]+\.[A-Za-z0-9-_=]+\.?[A-Za-z0-9-_.+/=]*)'
+        r'|(?P<api>apikey=[A-Za-z0-9-_=]+)'
+        r'|(?P<uid>user_id=eq\.[a-f0-9-]+)'
+        r'|(?P<uuid>\b[a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12}\b)'
+    )
+
+    filter = staticmethod(_make_filter(_COMBINED, _REPLACEMENTS, _CHEAP_TOKENS))
 
 # Configure logging
 logging.basicConfig(
@@ -44,76 +84,151 @@ logging.getLogger('httpx').setLevel(logging.WARNING)
 # Get our application logger
 logger = logging.getLogger(__name__)
 
-# Add the sensitive data filter
+# Attach the sensitive data filter to the root handler so records from every
+# logger are scrubbed, and only after level filtering has dropped them
 sensitive_filter = SensitiveDataFilter()
-logger.addFilter(sensitive_filter)
+logging.getLogger().handlers[0].addFilter(sensitive_filter)
 
 # Load environment variables from .env file if it exists (for local development)
 load_dotenv()
 
-# Get environment variables (works for both local .env and GitHub Actions secrets)
-WEATHER_API_KEY = os.getenv('WEATHER_API_KEY')
-SUPABASE_URL = os.getenv('SUPABASE_URL')
-SUPABASE_SERVICE_ROLE_KEY = os.getenv('SUPABASE_SERVICE_ROLE_KEY')
-SUPABASE_USER_EMAIL = os.getenv('SUPABASE_USER_EMAIL')
-SUPABASE_USER_PASSWORD = os.getenv('SUPABASE_USER_PASSWORD')
-
-# Validate required environment variables
-required_vars = {
-    'WEATHER_API_KEY': WEATHER_API_KEY,
-    'SUPABASE_URL': SUPABASE_URL,
-    'SUPABASE_SERVICE_ROLE_KEY': SUPABASE_SERVICE_ROLE_KEY,
-    'SUPABASE_USER_EMAIL': SUPABASE_USER_EMAIL,
-    'SUPABASE_USER_PASSWORD': SUPABASE_USER_PASSWORD
-}
-
-missing_vars = [var for var, value in required_vars.items() if not value]
-if missing_vars:
-    logger.error(f"Missing required environment variables: {', '.join(missing_vars)}")
-    raise ValueError(f"Missing required environment variables: {', '.join(missing_vars)}")
+class Config(NamedTuple):
+    """Required environment configuration, read once at import."""
+    weather_api_key: str
+    supabase_url: str
+    supabase_service_role_key: str
+    supabase_user_email: str
+    supabase_user_password: str
+
+_CONFIG_KEYS = tuple(field.upper() for field in Config._fields)
+
+def _load_config():
+    """Read the required environment variables into a Config, validating once."""
+    missing_vars = [var for var in _CONFIG_KEYS if not os.getenv(var)]
+    if missing_vars:
+        logger.error(f"Missing required environment variables: {', '.join(missing_vars)}")
+        raise ValueError(f"Missing required environment variables: {', '.join(missing_vars)}")
+    return Config(*(os.environ[var] for var in _CONFIG_KEYS))
+
+# Works for both local .env and GitHub Actions secrets
+CFG = _load_config()
+
+def _date_str(date):
+    """Format a date as YYYY-MM-DD; faster than strftime, which re-parses
+    the format string on every call."""
+    return f'{date.year:04d}-{date.month:02d}-{date.day:02d}'
+
+# Refresh token persisted between runs so repeat invocations skip the
+# password sign-in round-trip
+_SESSION_FILE = '.supabase_session'
+
+@functools.lru_cache(maxsize=1)
+def _get_client():
+    """Create and authenticate the Supabase client once per process.
+
+    A refresh token persisted by a previous run is tried first; password
+    sign-in is the fallback. The (possibly rotated) refresh token is written
+    back for the next invocation. Returns (client, user_id).
+    """
+    client: Client = create_client(CFG.supabase_url, CFG.supabase_service_role_key)
+
+    response = None
+    try:
+        with open(_SESSION_FILE) as f:
+            refresh_token = f.read().strip()
+        if refresh_token:
+            response = client.auth.refresh_session(refresh_token)
+            logger.info("Reused persisted Supabase session")
+    except FileNotFoundError:
+        pass
+    except Exception:
+        logger.info("Persisted Supabase session expired; signing in again")
+
+    if response is None:
+        try:
+            response = client.auth.sign_in_with_password({
+                "email": CFG.supabase_user_email,
+                "password": CFG.supabase_user_password
+            })
+            logger.info("Successfully authenticated with Supabase")
+        except Exception as e:
+            logger.error(f"Error signing in to Supabase: {str(e)}")
+            raise
+
+    try:
+        # Owner-only permissions: the file holds a live refresh token
+        fd = os.open(_SESSION_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            f.write(response.session.refresh_token)
+    except OSError:
+        logger.warning("Could not persist Supabase session for reuse")
+
+    return client, response.user.id
 
 class WeatherTracker:
+    # hour -> period lookup table; None for hours outside any period
+    HOUR_TO_PERIOD = (None,) * 6 + ('morning',) * 6 + ('afternoon',) * 6 + ('evening',) * 6
+
     def __init__(self):
         # Weather API setup
-        self.api_key = WEATHER_API_KEY
-        if not self.api_key:
-            logger.error("WEATHER_API_KEY not found in environment variables")
-            raise ValueError("WEATHER_API_KEY not found in environment variables")
-        
+        self.api_key = CFG.weather_api_key
         self.base_url = "http://api.weatherapi.com/v1"
         self.city = "Newcastle"
         self.country = "Australia"
+        self.location_str = f"{self.city}, {self.country}"
         self.lat = -32.9267
         self.lon = 151.7783
+        self._q = f"{self.lat},{self.lon}"
+
+        # Reuse one HTTP connection (with retries) across WeatherAPI calls.
+        # Responses are cached on disk forever: historical weather for a
+        # past date never changes, so reruns skip the network entirely.
+        self.http = requests_cache.CachedSession(
+            '.weather_cache',
+            backend='sqlite',
+            expire_after=None,
+            allowable_methods=('GET',)
+        )
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        )
+        self.http.mount("http://", adapter)
+        self.http.mount("https://", adapter)
+        # Static query parameters; only 'dt' varies between calls
+        self.http.params = {'key': self.api_key, 'q': self._q, 'hour': '0-23'}
 
         # Supabase setup
-        self.supabase_url = SUPABASE_URL
-        self.supabase_key = SUPABASE_SERVICE_ROLE_KEY
-        self.supabase_email = SUPABASE_USER_EMAIL
-        self.supabase_password = SUPABASE_USER_PASSWORD
-        
-        if not all([self.supabase_url, self.supabase_key, self.supabase_email, self.supabase_password]):
-            logger.error("Missing Supabase credentials in environment variables")
-            raise ValueError("Missing Supabase credentials in environment variables")
-        
-        self.supabase: Client = create_client(self.supabase_url, self.supabase_key)
-        self.user_id = self._sign_in_supabase()
-
-    def _sign_in_supabase(self):
-        """Sign in to Supabase with email and password and return user ID."""
-        try:
-            response = self.supabase.auth.sign_in_with_password({
-                "email": self.supabase_email,
-                "password": self.supabase_password
-            })
-            logger.info("Successfully authenticated with Supabase")
-            return response.user.id
-        except Exception as e:
-            logger.error(f"Error signing in to Supabase: {str(e)}")
-            raise
+        self.supabase_url = CFG.supabase_url
+        self.supabase_key = CFG.supabase_service_role_key
+        self.supabase_email = CFG.supabase_user_email
+        self.supabase_password = CFG.supabase_user_password
+
+        # Client creation and sign-in are deferred to the first DB access,
+        # so runs that fail before touching the database skip the auth trip
+        self._supabase = None
+        self._user_id = None
+
+        # Memoized results of check_existing_data for this run
+        self._existence_cache = {}
+
+    @property
+    def supabase(self) -> Client:
+        """Supabase client, created and signed in on first use."""
+        if self._supabase is None:
+            self._supabase, self._user_id = _get_client()
+        return self._supabase
+
+    @property
+    def user_id(self):
+        """ID of the signed-in user, triggering sign-in if needed."""
+        if self._user_id is None:
+            self.supabase
+        return self._user_id
 
     def _get_user_id(self):
-        """Get the current user's ID (deprecated, now handled in _sign_in_supabase)."""
+        """Get the current user's ID (deprecated, now handled in _get_client)."""
         try:
             user = self.supabase.auth.get_user()
             return user.user.id
@@ -123,14 +238,23 @@ class WeatherTracker:
 
     def check_existing_data(self, date):
         """Check if weather data already exists for the given date and user."""
+        date_str = _date_str(date)
+        cached = self._existence_cache.get(date_str)
+        if cached is not None:
+            return cached
+
         try:
+            # HEAD request with an exact count: no row bodies are transferred
             result = self.supabase.table('weather_data')\
-                .select('id')\
-                .eq('date', date.strftime('%Y-%m-%d'))\
+                .select('id', count='exact', head=True)\
+                .eq('date', date_str)\
                 .eq('user_id', self.user_id)\
+                .limit(1)\
                 .execute()
-            
-            return len(result.data) > 0
+
+            exists = (result.count or 0) > 0
+            self._existence_cache[date_str] = exists
+            return exists
         except Exception as e:
             logger.error("Error checking existing data")
             return False
@@ -139,101 +263,125 @@ class WeatherTracker:
         """Get historical weather data for a specific date."""
         url = f"{self.base_url}/history.json"
         
-        params = {
-            'key': self.api_key,
-            'q': f"{self.lat},{self.lon}",
-            'dt': date.strftime('%Y-%m-%d'),
-            'hour': '0-23'  # Get all hours
-        }
+        params = {'dt': _date_str(date)}
 
         try:
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            return response.json()
+            # Stream the body straight into the JSON parser, skipping the
+            # intermediate response.content bytes copy
+            with self.http.get(url, params=params, stream=True, timeout=(3.05, 30)) as response:
+                if response.status_code >= 400:
+                    raise requests.HTTPError(
+                        f"WeatherAPI returned status {response.status_code}",
+                        response=response
+                    )
+                response.raw.decode_content = True
+                data = orjson.loads(response.raw.read())
+                # Keep only the forecast section; 'location' and 'current'
+                # are never read downstream and would otherwise stay alive
+                # for the whole backfill fan-in
+                forecast = data.get('forecast')
+                return {'forecast': forecast} if forecast else data
         except requests.exceptions.RequestException as e:
             logger.error(f"Error fetching historical weather data: {str(e)}")
             return None
 
-    def analyze_weather_periods(self, weather_data):
-        """Analyze weather data and divide it into morning, afternoon, and evening periods."""
+    def get_historical_weather_many(self, dates):
+        """Fetch historical weather data for several dates concurrently."""
+        if not dates:
+            return {}
+
+        # GETs on the pooled session are thread-safe; the pool size caps
+        # how many connections the workers can hold at once
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            return dict(zip(dates, executor.map(self.get_historical_weather, dates)))
+
+    def summarize_day(self, weather_data):
+        """Summarize hourly weather into morning, afternoon, and evening averages."""
         if not weather_data or 'forecast' not in weather_data or 'forecastday' not in weather_data['forecast']:
             return None
 
         # Get the first (and only) forecast day
         day_data = weather_data['forecast']['forecastday'][0]
-        
-        periods = {
-            'morning': {'hours': range(6, 12), 'data': []},
-            'afternoon': {'hours': range(12, 18), 'data': []},
-            'evening': {'hours': range(18, 24), 'data': []}
-        }
 
+        # One pass over the hourly data, accumulating per-period running sums
+        accumulators = {}
         for hour_data in day_data['hour']:
-            hour = int(hour_data['time'].split()[1].split(':')[0])
-            for period, info in periods.items():
-                if hour in info['hours']:
-                    info['data'].append(hour_data)
-
-        return periods
-
-    def calculate_period_averages(self, periods):
-        """Calculate average weather conditions for each period."""
-        results = {}
-        
-        for period, data in periods.items():
-            if not data['data']:
+            # Time is always "YYYY-MM-DD HH:MM"; slice the hour out directly
+            hour = int(hour_data['time'][11:13])
+            period = self.HOUR_TO_PERIOD[hour]
+            if period is None:
                 continue
 
-            temps = [hour['temp_c'] for hour in data['data']]
-            feels_like = [hour['feelslike_c'] for hour in data['data']]
-            humidity = [hour['humidity'] for hour in data['data']]
-            wind_speed = [hour['wind_kph'] for hour in data['data']]
-            
-            # Get most common weather condition
-            weather_conditions = [hour['condition']['text'] for hour in data['data']]
-            most_common_weather = max(set(weather_conditions), key=weather_conditions.count)
-
-            results[period] = {
-                'avg_temp': sum(temps) / len(temps),
-                'avg_feels_like': sum(feels_like) / len(feels_like),
-                'avg_humidity': sum(humidity) / len(humidity),
-                'avg_wind_speed': sum(wind_speed) / len(wind_speed),
-                'weather_condition': most_common_weather
+            acc = accumulators.get(period)
+            if acc is None:
+                acc = accumulators[period] = {
+                    'count': 0,
+                    'temp': 0.0,
+                    'feels_like': 0.0,
+                    'humidity': 0.0,
+                    'wind': 0.0,
+                    'conditions': Counter()
+                }
+            acc['count'] += 1
+            acc['temp'] += hour_data['temp_c']
+            acc['feels_like'] += hour_data['feelslike_c']
+            acc['humidity'] += hour_data['humidity']
+            acc['wind'] += hour_data['wind_kph']
+            acc['conditions'][hour_data['condition']['text']] += 1
+
+        return {
+            period: {
+                'avg_temp': acc['temp'] / acc['count'],
+                'avg_feels_like': acc['feels_like'] / acc['count'],
+                'avg_humidity': acc['humidity'] / acc['count'],
+                'avg_wind_speed': acc['wind'] / acc['count'],
+                'weather_condition': acc['conditions'].most_common(1)[0][0]
             }
+            for period, acc in accumulators.items()
+        }
 
-        return results
+    def _build_records(self, date_str, period_averages):
+        """Build the insert rows for one date's period averages."""
+        return [
+            {
+                'date': date_str,
+                'location': self.location_str,
+                'period': period,
+                'temperature': round(data['avg_temp'], 1),
+                'humidity': round(data['avg_humidity'], 1),
+                'wind_speed': round(data['avg_wind_speed'], 1),
+                'weather_condition': data['weather_condition'],
+                'user_id': self.user_id
+            }
+            for period, data in period_averages.items()
+        ]
 
     def store_weather_data(self, date, period_averages):
         """Store weather data in Supabase."""
+        date_str = _date_str(date)
         try:
-            # Check if data already exists for this date and user
-            if self.check_existing_data(date):
-                logger.info(f"Weather data for {date.strftime('%Y-%m-%d')} already exists. Skipping insertion.")
+            logger.info("Starting data insertion...")
+            records = self._build_records(date_str, period_averages)
+
+            if not records:
+                logger.info("No period data to store.")
                 return
 
-            logger.info("Starting data insertion...")
-            for period, data in period_averages.items():
-                logger.info(f"Processing {period} data...")
-                weather_record = {
-                    'date': date.strftime('%Y-%m-%d'),
-                    'location': f"{self.city}, {self.country}",
-                    'period': period,
-                    'temperature': round(data['avg_temp'], 1),
-                    'humidity': round(data['avg_humidity'], 1),
-                    'wind_speed': round(data['avg_wind_speed'], 1),
-                    'weather_condition': data['weather_condition'],
-                    'user_id': self.user_id
-                }
-                
-                # Insert data into Supabase
-                logger.info(f"Inserting {period} data into Supabase...")
-                result = self.supabase.table('weather_data').insert(weather_record).execute()
-                
-                if hasattr(result, 'error') and result.error:
-                    logger.error("Error storing data")
-                else:
-                    logger.info(f"Successfully stored {period} data")
-                    
+            # A single upsert both inserts and deduplicates: rows already
+            # present for (user_id, date, period) are left untouched
+            logger.info(f"Upserting {len(records)} period records into Supabase...")
+            result = self.supabase.table('weather_data').upsert(
+                records,
+                on_conflict='user_id,date,period',
+                ignore_duplicates=True
+            ).execute()
+
+            if getattr(result, 'error', None):
+                logger.error("Error storing data")
+            else:
+                logger.info(f"Successfully stored {len(records)} period records")
+                self._existence_cache[date_str] = True
+
         except Exception as e:
             logger.error("Error storing weather data")
         finally:
@@ -241,24 +389,30 @@ class WeatherTracker:
 
     def print_weather_report(self, date, period_averages):
         """Print a formatted weather report."""
-        logger.info(f"\nWeather Report for Newcastle, AU - {date.strftime('%Y-%m-%d')}")
-        logger.info("=" * 50)
+        lines = [
+            f"\nWeather Report for Newcastle, AU - {_date_str(date)}",
+            "=" * 50
+        ]
 
         for period, data in period_averages.items():
-            logger.info(f"\n{period.capitalize()}:")
-            logger.info(f"Temperature: {data['avg_temp']:.1f}°C")
-            logger.info(f"Feels like: {data['avg_feels_like']:.1f}°C")
-            logger.info(f"Humidity: {data['avg_humidity']:.1f}%")
-            logger.info(f"Wind Speed: {data['avg_wind_speed']:.1f} km/h")
-            logger.info(f"Weather: {data['weather_condition']}")
+            lines.append(f"\n{period.capitalize()}:")
+            lines.append(f"Temperature: {data['avg_temp']:.1f}°C")
+            lines.append(f"Feels like: {data['avg_feels_like']:.1f}°C")
+            lines.append(f"Humidity: {data['avg_humidity']:.1f}%")
+            lines.append(f"Wind Speed: {data['avg_wind_speed']:.1f} km/h")
+            lines.append(f"Weather: {data['weather_condition']}")
+
+        # One log record for the whole report instead of one per line
+        logger.info("\n".join(lines))
 
     def cleanup(self):
         """Clean up resources and close connections."""
         try:
-            if hasattr(self, 'supabase'):
-                # Sign out from Supabase
-                self.supabase.auth.sign_out()
-                logger.info("Successfully signed out from Supabase")
+            if hasattr(self, 'http'):
+                self.http.close()
+            # The Supabase session stays signed in: its refresh token is
+            # persisted so the next invocation can reuse it instead of
+            # performing a password sign-in
         except Exception as e:
             logger.error(f"Error during cleanup: {str(e)}")
 
@@ -281,30 +435,22 @@ class WeatherTracker:
 
     def process_date(self, date):
         """Process weather data for a specific date."""
+        date_str = _date_str(date)
         try:
-            # Check if data already exists
-            if self.check_existing_data(date):
-                logger.info(f"Weather data for {date.strftime('%Y-%m-%d')} already exists. Skipping.")
-                return True
-
             # Get historical weather data
-            logger.info(f"Fetching historical weather data for {date.strftime('%Y-%m-%d')}...")
+            logger.info(f"Fetching historical weather data for {date_str}...")
             weather_data = self.get_historical_weather(date)
             if not weather_data:
-                logger.error(f"Failed to fetch weather data for {date.strftime('%Y-%m-%d')}")
+                logger.error(f"Failed to fetch weather data for {date_str}")
                 return False
 
-            # Analyze weather periods
+            # Summarize the day into period averages
             logger.info("Analyzing weather periods...")
-            periods = self.analyze_weather_periods(weather_data)
-            if not periods:
+            period_averages = self.summarize_day(weather_data)
+            if not period_averages:
                 logger.error("Failed to analyze weather periods")
                 return False
 
-            # Calculate averages
-            logger.info("Calculating period averages...")
-            period_averages = self.calculate_period_averages(periods)
-            
             # Print report
             self.print_weather_report(date, period_averages)
             
@@ -314,9 +460,71 @@ class WeatherTracker:
             return True
 
         except Exception as e:
-            logger.error(f"Error processing date {date.strftime('%Y-%m-%d')}: {str(e)}")
+            logger.error(f"Error processing date {date_str}: {str(e)}")
             return False
 
+    def backfill(self, dates):
+        """Backfill weather data for a list of dates with batched round-trips.
+
+        Probes which dates already exist in one query, fetches the missing
+        days concurrently, and inserts every period record in one request.
+        """
+        if not dates:
+            return True
+
+        date_strs = {date: _date_str(date) for date in dates}
+
+        # One range query finds every requested date that is already stored;
+        # the URL stays short no matter how many dates are being backfilled
+        try:
+            result = self.supabase.table('weather_data')\
+                .select('date')\
+                .gte('date', min(date_strs.values()))\
+                .lte('date', max(date_strs.values()))\
+                .eq('user_id', self.user_id)\
+                .execute()
+            existing = {row['date'] for row in result.data}
+        except Exception as e:
+            logger.error("Error checking existing data for backfill")
+            return False
+
+        missing = [date for date, date_str in date_strs.items() if date_str not in existing]
+        if not missing:
+            logger.info("All requested dates already stored. Nothing to backfill.")
+            return True
+
+        logger.info(f"Backfilling {len(missing)} missing date(s)...")
+        weather_by_date = self.get_historical_weather_many(missing)
+
+        records = []
+        failed = []
+        for date in missing:
+            period_averages = self.summarize_day(weather_by_date.get(date))
+            if not period_averages:
+                failed.append(date_strs[date])
+                continue
+            self.print_weather_report(date, period_averages)
+            records.extend(self._build_records(date_strs[date], period_averages))
+
+        if failed:
+            logger.error(f"Failed to summarize weather data for: {', '.join(failed)}")
+
+        if records:
+            logger.info(f"Upserting {len(records)} period records into Supabase...")
+            result = self.supabase.table('weather_data').upsert(
+                records,
+                on_conflict='user_id,date,period',
+                ignore_duplicates=True
+            ).execute()
+            if getattr(result, 'error', None):
+                logger.error("Error storing backfill data")
+                return False
+            logger.info(f"Successfully stored {len(records)} period records")
+            for record in records:
+                self._existence_cache[record['date']] = True
+
+        return not failed
+
 def main():
     tracker = None
     try:
@@ -343,18 +551,21 @@ def main():
             # Start from the day after the last stored date
             start_date = last_stored_date + timedelta(days=1)
         
-        # Process all missing dates up to yesterday
+        # Nothing to do when the database already has yesterday's data
+        if start_date > yesterday:
+            logger.info("Weather data is already up to date.")
+            return
+
+        # Collect all missing dates and backfill them concurrently
+        dates = []
         current_date = start_date
         while current_date <= yesterday:
-            logger.info(f"\nProcessing date: {current_date.strftime('%Y-%m-%d')}")
-            success = tracker.process_date(current_date)
-            
-            if not success:
-                logger.error(f"Failed to process date {current_date.strftime('%Y-%m-%d')}")
-                # Continue with next date even if current one fails
-                
+            dates.append(current_date)
             current_date += timedelta(days=1)
-        
+
+        if not tracker.backfill(dates):
+            logger.error("Backfill completed with errors")
+
         logger.info("Script execution completed successfully.")
 
     except Exception as e: